@@ -0,0 +1,389 @@
+# app/bulk_ingest.py
+"""
+Bulk corpus ingestion from the command line.
+
+Ingests every supported file in a directory (recursively) or a zip archive
+using the same nodes as the /ingest route, spread across a process pool with
+one embedding model loaded per worker. Progress is tracked in a local SQLite
+checkpoint so a rerun skips finished files and already-upserted chunks.
+
+Usage:
+    python -m app.bulk_ingest data/sample --workers 4
+    python -m app.bulk_ingest corpus.zip --checkpoint data/ingest_checkpoint.db
+"""
+import argparse
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+import uuid
+import zipfile
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+
+from .nodes.extract import extractor
+from .nodes.clean_data import data_cleaner
+from .nodes.chunker import chunk_from_pages
+from .nodes.embedding import load_model, embed_chunks
+from .nodes.vector_upsert import vector_upsert, get_client
+from .doc_registry import register_document
+
+SUPPORTED_EXTENSIONS = {"pdf", "docx", "txt"}
+DEFAULT_CHECKPOINT = os.getenv("INGEST_CHECKPOINT_PATH", "data/ingest_checkpoint.db")
+DEFAULT_MODEL = os.getenv("EMBEDDING_MODEL", "all-MiniLM-L6-v2")
+PROGRESS_INTERVAL_S = 1.0
+
+
+class Checkpoint:
+    """
+    SQLite-backed record of ingested files and upserted chunks.
+    Safe to open from several processes at once (WAL + busy timeout).
+    """
+
+    def __init__(self, path: str):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(path, timeout=30)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS files (
+                file_key    TEXT PRIMARY KEY,
+                doc_id      TEXT NOT NULL,
+                status      TEXT NOT NULL,
+                page_count  INTEGER,
+                chunk_count INTEGER,
+                error       TEXT,
+                updated_at  REAL
+            );
+            CREATE TABLE IF NOT EXISTS chunks (
+                chunk_id TEXT PRIMARY KEY,
+                doc_id   TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS chunks_doc_id ON chunks(doc_id);
+            -- running totals, so progress polling does not scan chunks
+            CREATE TABLE IF NOT EXISTS counters (
+                name  TEXT PRIMARY KEY,
+                value INTEGER NOT NULL
+            );
+            -- seed once (checkpoints from older runs); skipped without a scan afterwards
+            INSERT INTO counters (name, value)
+                SELECT 'chunks', (SELECT COUNT(*) FROM chunks)
+                WHERE NOT EXISTS (SELECT 1 FROM counters WHERE name = 'chunks');
+            """
+        )
+        self.conn.commit()
+
+    def get_file(self, file_key: str) -> Optional[Dict[str, Any]]:
+        row = self.conn.execute(
+            "SELECT doc_id, status FROM files WHERE file_key = ?", (file_key,)
+        ).fetchone()
+        if row is None:
+            return None
+        return {"doc_id": row[0], "status": row[1]}
+
+    def mark_file(self, file_key: str, doc_id: str, status: str, page_count: int = None,
+                  chunk_count: int = None, error: str = None):
+        self.conn.execute(
+            """
+            INSERT INTO files (file_key, doc_id, status, page_count, chunk_count, error, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(file_key) DO UPDATE SET
+                doc_id = excluded.doc_id,
+                status = excluded.status,
+                page_count = excluded.page_count,
+                chunk_count = excluded.chunk_count,
+                error = excluded.error,
+                updated_at = excluded.updated_at
+            """,
+            (file_key, doc_id, status, page_count, chunk_count, error, time.time()),
+        )
+        self.conn.commit()
+
+    def done_chunks(self, doc_id: str) -> set:
+        rows = self.conn.execute("SELECT chunk_id FROM chunks WHERE doc_id = ?", (doc_id,))
+        return {r[0] for r in rows}
+
+    def count_chunks(self) -> int:
+        return self.conn.execute("SELECT value FROM counters WHERE name = 'chunks'").fetchone()[0]
+
+    def _add_to_chunk_count(self, delta: int):
+        self.conn.execute("UPDATE counters SET value = value + ? WHERE name = 'chunks'", (delta,))
+
+    def mark_chunks(self, doc_id: str, chunk_ids: List[str]):
+        with self.conn:
+            cur = self.conn.executemany(
+                "INSERT OR IGNORE INTO chunks (chunk_id, doc_id) VALUES (?, ?)",
+                [(cid, doc_id) for cid in chunk_ids],
+            )
+            self._add_to_chunk_count(cur.rowcount)
+
+    def forget_doc(self, doc_id: str):
+        """Drop the file and chunk rows of a deleted document."""
+        with self.conn:
+            self.conn.execute("DELETE FROM files WHERE doc_id = ?", (doc_id,))
+            cur = self.conn.execute("DELETE FROM chunks WHERE doc_id = ?", (doc_id,))
+            self._add_to_chunk_count(-cur.rowcount)
+
+    def close(self):
+        self.conn.close()
+
+
+def discover_files(source: str) -> List[Dict[str, str]]:
+    """
+    List ingestible files under a directory or inside a zip archive.
+    Each entry has: file_key (stable id used by the checkpoint), source, member, filename.
+    """
+    src = Path(source)
+    tasks = []
+
+    if src.is_dir():
+        for p in sorted(src.rglob("*")):
+            if p.is_file() and p.suffix.lstrip(".").lower() in SUPPORTED_EXTENSIONS:
+                tasks.append({
+                    "file_key": str(p.resolve()),
+                    "source": str(p),
+                    "member": None,
+                    "filename": p.name,
+                })
+    elif src.is_file() and zipfile.is_zipfile(src):
+        with zipfile.ZipFile(src) as zf:
+            for info in sorted(zf.infolist(), key=lambda i: i.filename):
+                name = info.filename
+                if info.is_dir() or "." not in name:
+                    continue
+                if name.rsplit(".", 1)[-1].lower() not in SUPPORTED_EXTENSIONS:
+                    continue
+                tasks.append({
+                    "file_key": f"{src.resolve()}::{name}",
+                    "source": str(src),
+                    "member": name,
+                    "filename": Path(name).name,
+                })
+    else:
+        raise ValueError(f"Source must be a directory or a zip archive: {source}")
+
+    return tasks
+
+
+def forget_document(doc_id: str, checkpoint_path: str = DEFAULT_CHECKPOINT):
+    """
+    Remove a deleted document from the checkpoint so rerunning bulk ingest
+    re-ingests its file. No-op when no checkpoint exists.
+    """
+    if not Path(checkpoint_path).exists():
+        return
+    checkpoint = Checkpoint(checkpoint_path)
+    try:
+        checkpoint.forget_doc(doc_id)
+    finally:
+        checkpoint.close()
+
+
+# ---- worker side ----
+
+_WORKER_MODEL_NAME = DEFAULT_MODEL
+_WORKER_CHECKPOINT: Optional[Checkpoint] = None
+_WORKER_CLIENT = None
+
+
+def _init_worker(model_name: str, checkpoint_path: str):
+    """Load the embedding model and open the Weaviate client once per worker process."""
+    global _WORKER_MODEL_NAME, _WORKER_CHECKPOINT, _WORKER_CLIENT
+    _WORKER_MODEL_NAME = model_name
+    load_model(model_name)
+    _WORKER_CHECKPOINT = Checkpoint(checkpoint_path)
+    _WORKER_CLIENT = get_client()
+
+
+def _ingest_file(task: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Run extract -> clean -> chunk -> embed -> upsert for one file.
+    Chunks already recorded in the checkpoint are skipped; new ones are
+    recorded after each upserted batch so a crash loses at most one batch.
+    """
+    doc_id = task["doc_id"]
+
+    if task["member"] is None:
+        extract_res = extractor(task["source"], doc_id=doc_id)
+    else:
+        # zip members only live on disk long enough to be extracted
+        suffix = Path(task["filename"]).suffix
+        with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as tmp:
+            with zipfile.ZipFile(task["source"]) as zf:
+                tmp.write(zf.read(task["member"]))
+        try:
+            extract_res = extractor(tmp.name, doc_id=doc_id)
+        finally:
+            os.remove(tmp.name)
+
+    san = data_cleaner(extract_res.get("page_texts", []), doc_id=doc_id)
+    chunks = chunk_from_pages(san.get("cleaned_page_texts", []), doc_id=doc_id)
+
+    done = _WORKER_CHECKPOINT.done_chunks(doc_id)
+    pending = [c for c in chunks if c["chunk_id"] not in done]
+
+    batch_size = task["batch_size"]
+    for start in range(0, len(pending), batch_size):
+        batch = embed_chunks(pending[start:start + batch_size], model_name=_WORKER_MODEL_NAME)
+        objects = []
+        for c in batch:
+            objects.append({
+                "id": c["chunk_id"],
+                "vector": c["vector"],
+                "properties": {
+                    "text": c["text"],
+                    "doc_id": c["doc_id"],
+                    "page": c.get("page")
+                }
+            })
+        vector_upsert(objects, client=_WORKER_CLIENT)
+        _WORKER_CHECKPOINT.mark_chunks(doc_id, [c["chunk_id"] for c in batch])
+
+    return {
+        "file_key": task["file_key"],
+        "doc_id": doc_id,
+        "page_count": extract_res.get("page_count"),
+        "chunks": len(chunks),
+        "new_chunks": len(pending),
+    }
+
+
+# ---- parent side ----
+
+def _format_eta(seconds: float) -> str:
+    if seconds == float("inf"):
+        return "--:--"
+    seconds = int(seconds)
+    h, rem = divmod(seconds, 3600)
+    m, s = divmod(rem, 60)
+    return f"{h:d}:{m:02d}:{s:02d}" if h else f"{m:02d}:{s:02d}"
+
+
+def _print_progress(done: int, failed: int, total: int, chunks: int, started: float):
+    elapsed = max(time.time() - started, 1e-6)
+    finished = done + failed
+    files_rate = finished / elapsed
+    chunk_rate = chunks / elapsed
+    eta = (total - finished) / files_rate if files_rate > 0 else float("inf")
+    line = (
+        f"\r[{finished}/{total}] ok={done} failed={failed} "
+        f"{files_rate:.2f} files/s {chunk_rate:.1f} chunks/s ETA {_format_eta(eta)}"
+    )
+    sys.stderr.write(line)
+    sys.stderr.flush()
+
+
+def bulk_ingest(
+    source: str,
+    checkpoint_path: str = DEFAULT_CHECKPOINT,
+    workers: int = None,
+    model_name: str = DEFAULT_MODEL,
+    batch_size: int = 64,
+    skip_failed: bool = False,
+    mp_context=None,
+) -> Dict[str, Any]:
+    """
+    Ingest every supported file in `source` (directory or zip archive).
+    Files that failed on an earlier run are retried unless skip_failed is set.
+    mp_context is passed to the ProcessPoolExecutor (default start method if None).
+    Returns summary counts for the run.
+    """
+    workers = workers or min(4, os.cpu_count() or 1)
+    checkpoint = Checkpoint(checkpoint_path)
+
+    tasks = []
+    already_done = retried = skipped_failed = 0
+    for t in discover_files(source):
+        prev = checkpoint.get_file(t["file_key"])
+        if prev and prev["status"] == "done":
+            already_done += 1
+            continue
+        if prev and prev["status"] == "failed":
+            if skip_failed:
+                skipped_failed += 1
+                continue
+            retried += 1
+        # reuse the doc_id of a partially ingested file so its chunk ids line up
+        doc_id = prev["doc_id"] if prev else str(uuid.uuid4())
+        checkpoint.mark_file(t["file_key"], doc_id, "running")
+        tasks.append(dict(t, doc_id=doc_id, batch_size=batch_size))
+
+    total = len(tasks)
+    print(
+        f"{total} file(s) to ingest ({retried} retried after an earlier failure), "
+        f"{already_done} already done, {skipped_failed} failed and skipped, {workers} worker(s)",
+        file=sys.stderr,
+    )
+
+    done = failed = chunks = 0
+    started = time.time()
+    if tasks:
+        # workers record each upserted batch in the checkpoint; polling its chunk
+        # count gives live throughput even while a large file is still running
+        chunks_before = checkpoint.count_chunks()
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(model_name, checkpoint_path),
+            mp_context=mp_context,
+        ) as pool:
+            futures = {pool.submit(_ingest_file, t): t for t in tasks}
+            pending = set(futures)
+            while pending:
+                finished, pending = wait(pending, timeout=PROGRESS_INTERVAL_S, return_when=FIRST_COMPLETED)
+                for fut in finished:
+                    t = futures[fut]
+                    try:
+                        res = fut.result()
+                        checkpoint.mark_file(t["file_key"], t["doc_id"], "done",
+                                             page_count=res["page_count"], chunk_count=res["chunks"])
+                        register_document(t["doc_id"], t["filename"], res["page_count"], res["chunks"])
+                        done += 1
+                    except Exception as e:
+                        checkpoint.mark_file(t["file_key"], t["doc_id"], "failed", error=str(e))
+                        failed += 1
+                        sys.stderr.write(f"\nfailed: {t['file_key']}: {e}\n")
+                chunks = checkpoint.count_chunks() - chunks_before
+                _print_progress(done, failed, total, chunks, started)
+        sys.stderr.write("\n")
+
+    checkpoint.close()
+    return {
+        "files_total": total + already_done + skipped_failed,
+        "files_ingested": done,
+        "files_failed": failed,
+        "files_already_done": already_done,
+        "files_retried": retried,
+        "files_skipped_failed": skipped_failed,
+        "chunks_upserted": chunks,
+        "elapsed_s": round(time.time() - started, 2),
+    }
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Bulk-ingest a directory or zip archive into Weaviate.")
+    parser.add_argument("source", help="directory (searched recursively) or .zip archive")
+    parser.add_argument("--checkpoint", default=DEFAULT_CHECKPOINT, help="SQLite checkpoint path")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: min(4, cpus))")
+    parser.add_argument("--model", default=DEFAULT_MODEL, help="sentence-transformers model name")
+    parser.add_argument("--batch-size", type=int, default=64, help="chunks embedded/upserted per batch")
+    parser.add_argument("--skip-failed", action="store_true", help="do not retry files that failed on a previous run")
+    args = parser.parse_args(argv)
+
+    summary = bulk_ingest(
+        args.source,
+        checkpoint_path=args.checkpoint,
+        workers=args.workers,
+        model_name=args.model,
+        batch_size=args.batch_size,
+        skip_failed=args.skip_failed,
+    )
+    print(summary)
+    # non-zero while any file is still in the failed state, including skipped ones
+    return 1 if summary["files_failed"] or summary["files_skipped_failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,77 @@
+# app/doc_registry.py
+"""
+SQLite registry of ingested documents: doc_id -> filename, page count,
+chunk count and ingest time. Written by ingest_document and the bulk
+ingestion CLI, read by GET /documents.
+"""
+import os
+import sqlite3
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+
+DOC_REGISTRY_PATH = os.getenv("DOC_REGISTRY_PATH", "data/doc_registry.db")
+
+
+@contextmanager
+def _connect():
+    # one short-lived connection per call keeps this safe from FastAPI's threadpool
+    Path(DOC_REGISTRY_PATH).parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(DOC_REGISTRY_PATH, timeout=30)
+    conn.row_factory = sqlite3.Row
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS documents (
+            doc_id      TEXT PRIMARY KEY,
+            filename    TEXT,
+            page_count  INTEGER,
+            chunk_count INTEGER,
+            ingested_at REAL
+        )
+        """
+    )
+    try:
+        with conn:  # commit on success, roll back on error
+            yield conn
+    finally:
+        conn.close()
+
+
+def register_document(doc_id: str, filename: str, page_count: int, chunk_count: int) -> Dict[str, Any]:
+    """Insert or replace the registry entry for a document."""
+    record = {
+        "doc_id": doc_id,
+        "filename": filename,
+        "page_count": page_count,
+        "chunk_count": chunk_count,
+        "ingested_at": time.time(),
+    }
+    with _connect() as conn:
+        conn.execute(
+            """
+            INSERT OR REPLACE INTO documents (doc_id, filename, page_count, chunk_count, ingested_at)
+            VALUES (:doc_id, :filename, :page_count, :chunk_count, :ingested_at)
+            """,
+            record,
+        )
+    return record
+
+
+def list_documents() -> List[Dict[str, Any]]:
+    with _connect() as conn:
+        rows = conn.execute("SELECT * FROM documents ORDER BY ingested_at DESC").fetchall()
+    return [dict(r) for r in rows]
+
+
+def get_document(doc_id: str) -> Optional[Dict[str, Any]]:
+    with _connect() as conn:
+        row = conn.execute("SELECT * FROM documents WHERE doc_id = ?", (doc_id,)).fetchone()
+    return dict(row) if row else None
+
+
+def unregister_document(doc_id: str) -> bool:
+    """Remove a document from the registry. Returns False if it was not registered."""
+    with _connect() as conn:
+        cur = conn.execute("DELETE FROM documents WHERE doc_id = ?", (doc_id,))
+    return cur.rowcount > 0
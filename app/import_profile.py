@@ -0,0 +1,84 @@
+# app/import_profile.py
+"""
+Import-time profile report.
+
+Runs `python -X importtime -c "import <module>"` in a fresh interpreter and
+prints the total import time and the slowest modules, so regressions in cold
+start are easy to spot.
+
+Usage:
+    python -m app.import_profile                  # profiles app.main
+    python -m app.import_profile app.langchain_config --top 30
+    python -m app.import_profile --budget-ms 500  # exit 1 if over budget
+"""
+import argparse
+import subprocess
+import sys
+from typing import Dict, Any, List
+
+
+def profile_imports(module: str = "app.main") -> Dict[str, Any]:
+    """
+    Import `module` in a subprocess with -X importtime and parse the report.
+    Returns { "module", "total_us", "entries": [{"name", "self_us", "cumulative_us", "depth"}] }
+    """
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"importing {module} failed:\n{proc.stderr.strip()[-2000:]}")
+
+    entries = []
+    for line in proc.stderr.splitlines():
+        # format: "import time:   self [us] | cumulative | imported package"
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue  # header line
+        name = parts[2].rstrip()
+        entries.append({
+            "name": name.strip(),
+            "self_us": int(parts[0]),
+            "cumulative_us": int(parts[1]),
+            "depth": (len(name) - len(name.lstrip())) // 2,
+        })
+
+    top_level = [e for e in entries if e["depth"] == 0]
+    target = next((e for e in entries if e["name"] == module), None)
+    total_us = target["cumulative_us"] if target else sum(e["cumulative_us"] for e in top_level)
+    return {"module": module, "total_us": total_us, "entries": entries}
+
+
+def format_report(profile: Dict[str, Any], top: int = 20) -> str:
+    entries: List[Dict[str, Any]] = profile["entries"]
+    lines = [
+        f"import {profile['module']}: {profile['total_us'] / 1000:.1f} ms total, {len(entries)} modules",
+        "",
+        f"{'cumulative ms':>14} {'self ms':>9}  module",
+    ]
+    for e in sorted(entries, key=lambda e: e["cumulative_us"], reverse=True)[:top]:
+        lines.append(f"{e['cumulative_us'] / 1000:>14.1f} {e['self_us'] / 1000:>9.1f}  {e['name']}")
+    return "\n".join(lines)
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Report import time for a module.")
+    parser.add_argument("module", nargs="?", default="app.main")
+    parser.add_argument("--top", type=int, default=20, help="number of slowest modules to show")
+    parser.add_argument("--budget-ms", type=float, default=None, help="fail if total import time exceeds this")
+    args = parser.parse_args(argv)
+
+    profile = profile_imports(args.module)
+    print(format_report(profile, top=args.top))
+
+    if args.budget_ms is not None and profile["total_us"] / 1000 > args.budget_ms:
+        print(f"\nover budget: {profile['total_us'] / 1000:.1f} ms > {args.budget_ms} ms", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
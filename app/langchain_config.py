@@ -1,33 +1,60 @@
 # app/langchain_config.py
 import os
-import weaviate
-from typing import Optional
-
-# community integrations for embeddings & vectorstores
-from langchain_community.embeddings import SentenceTransformerEmbeddings
-from langchain_community.vectorstores import Weaviate
-
-# LLM wrapper for Groq
-from langchain_groq import ChatGroq
-
-# Attempt to import RetrievalQA (older API) and/or create_retrieval_chain (newer API)
-RetrievalQA = None
-create_retrieval_chain = None
-try:
-    # try the class (older / classic usage)
-    from langchain.chains.retrieval_qa.base import RetrievalQA  # explicit path
-except Exception:
-    try:
-        from langchain.chains import RetrievalQA  # sometimes exported here
-    except Exception:
-        RetrievalQA = None
+import threading
+from typing import Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import weaviate
+
+# Heavy integrations (weaviate, langchain_community -> sentence-transformers/torch,
+# langchain_groq, langchain chains) are imported inside the functions that use
+# them so that importing app.main stays cheap. See app/preload.py to warm them
+# up on startup instead of on the first request.
 
-if RetrievalQA is None:
-    # try the helper used in newer docs
+_UNSET = object()
+_RETRIEVAL_HELPERS = _UNSET
+_CLIENT = None
+_EMBEDDINGS = None
+# one lock per singleton so the preload can still build them in parallel
+_RETRIEVAL_LOCK = threading.Lock()
+_CLIENT_LOCK = threading.Lock()
+_EMBEDDINGS_LOCK = threading.Lock()
+
+
+def _load_retrieval_helpers():
+    """
+    Resolve RetrievalQA (older API) and/or create_retrieval_chain (newer API) once.
+    Returns (RetrievalQA, create_retrieval_chain); either may be None.
+    """
+    global _RETRIEVAL_HELPERS
+    if _RETRIEVAL_HELPERS is not _UNSET:
+        return _RETRIEVAL_HELPERS
+    with _RETRIEVAL_LOCK:
+        if _RETRIEVAL_HELPERS is _UNSET:
+            _RETRIEVAL_HELPERS = _resolve_retrieval_helpers()
+    return _RETRIEVAL_HELPERS
+
+
+def _resolve_retrieval_helpers():
+    RetrievalQA = None
+    create_retrieval_chain = None
     try:
-        from langchain.chains.retrieval import create_retrieval_chain
+        # try the class (older / classic usage)
+        from langchain.chains.retrieval_qa.base import RetrievalQA  # explicit path
     except Exception:
-        create_retrieval_chain = None
+        try:
+            from langchain.chains import RetrievalQA  # sometimes exported here
+        except Exception:
+            RetrievalQA = None
+
+    if RetrievalQA is None:
+        # try the helper used in newer docs
+        try:
+            from langchain.chains.retrieval import create_retrieval_chain
+        except Exception:
+            create_retrieval_chain = None
+
+    return RetrievalQA, create_retrieval_chain
 
 # config
 WEAVIATE_URL = os.getenv("WEAVIATE_URL", "http://localhost:8080")
@@ -36,16 +63,34 @@ WEAVIATE_INDEX = os.getenv("WEAVIATE_INDEX", "DocumentChunk")
 GROQ_API_KEY = os.getenv("GROQ_API_KEY")
 GROQ_DEFAULT_MODEL = os.getenv("GROQ_MODEL", "llama-3.1-2b-instant")
 
-def get_weaviate_client() -> weaviate.WeaviateClient:
-    # v4 client: use .connect_to_local() with URL
-    return weaviate.connect_to_local(WEAVIATE_URL)
+def get_weaviate_client() -> "weaviate.WeaviateClient":
+    # v4 client: use .connect_to_local() with URL; reused across requests
+    global _CLIENT
+    if _CLIENT is None:
+        with _CLIENT_LOCK:
+            if _CLIENT is None:
+                import weaviate
+                _CLIENT = weaviate.connect_to_local(WEAVIATE_URL)
+    return _CLIENT
 
 
 def get_embeddings():
-    return SentenceTransformerEmbeddings(model_name=EMBEDDING_MODEL)
+    # loading the sentence-transformers model is the slowest step, so keep one
+    global _EMBEDDINGS
+    if _EMBEDDINGS is None:
+        with _EMBEDDINGS_LOCK:
+            if _EMBEDDINGS is None:
+                from langchain_community.embeddings import SentenceTransformerEmbeddings
+                from .nodes import embedding
+                _EMBEDDINGS = SentenceTransformerEmbeddings(model_name=EMBEDDING_MODEL)
+                # share the loaded model with app.nodes.embedding (used by ingestion)
+                embedding.set_model(_EMBEDDINGS.client)
+    return _EMBEDDINGS
 
 
 def get_vectorstore():
+    from langchain_community.vectorstores import Weaviate
+
     client = get_weaviate_client()
     embeddings = get_embeddings()
     return Weaviate(
@@ -57,25 +102,31 @@ def get_vectorstore():
     )
 
 
-def get_retriever(k: int = 5):
+def get_retriever(k: int = 5, where_filter: Optional[dict] = None):
     vs = get_vectorstore()
-    return vs.as_retriever(search_type="similarity", search_kwargs={"k": k})
+    search_kwargs = {"k": k}
+    if where_filter:
+        # passed to Weaviate's nearVector query, i.e. filtered before ranking
+        search_kwargs["where_filter"] = where_filter
+    return vs.as_retriever(search_type="similarity", search_kwargs=search_kwargs)
 
 
 def get_llm(model: Optional[str] = None):
     m = model or GROQ_DEFAULT_MODEL
     if not GROQ_API_KEY:
         raise ValueError("GROQ_API_KEY not set in environment")
+    from langchain_groq import ChatGroq
     return ChatGroq(api_key=GROQ_API_KEY, model_name=m)
 
 
-def get_qa_chain(k: int = 5, model: Optional[str] = None):
+def get_qa_chain(k: int = 5, model: Optional[str] = None, where_filter: Optional[dict] = None):
     """
     Returns a chain-like callable object that you can invoke with {"query": "..."}.
     Uses RetrievalQA class if available, otherwise falls back to create_retrieval_chain helper.
     """
-    retriever = get_retriever(k=k)
+    retriever = get_retriever(k=k, where_filter=where_filter)
     llm = get_llm(model)
+    RetrievalQA, create_retrieval_chain = _load_retrieval_helpers()
 
     if RetrievalQA is not None:
         # classic pattern
@@ -1,11 +1,13 @@
-from typing import Dict, Any, List, Tuple
-from .langchain_config import get_qa_chain
+from typing import Dict, Any, List, Tuple, Optional
+from .langchain_config import get_qa_chain, get_embeddings
+from .doc_registry import register_document
 from .nodes.file_loader import file_loader_from_bytes
 from .nodes.extract import extractor
 from .nodes.clean_data import data_cleaner
 from .nodes.chunker import chunk_from_pages
 from .nodes.embedding import embed_chunks
 from .nodes.vector_upsert import vector_upsert, create_schema
+from .nodes.vector_search import build_where_filter
 
 # Simple helper: ingest a file end-to-end and upsert to Weaviate
 def ingest_document(file_bytes: bytes, filename: str) -> Dict[str, Any]:
@@ -24,6 +26,7 @@ def ingest_document(file_bytes: bytes, filename: str) -> Dict[str, Any]:
     cleaned_pages = san.get("cleaned_page_texts", [])
 
     chunks = chunk_from_pages(cleaned_pages, doc_id=doc_id)
+    get_embeddings()  # loads the model once and shares it with embed_chunks
     embedded = embed_chunks(chunks)
 
     objects = []
@@ -41,6 +44,8 @@ def ingest_document(file_bytes: bytes, filename: str) -> Dict[str, Any]:
     # create_schema()  # uncomment if you want ingestion to create/reset schema automatically
     vector_upsert(objects)
 
+    register_document(doc_id, loader.get("filename"), extract_res.get("page_count"), len(chunks))
+
     return {
         "doc_id": doc_id,
         "file_path": file_path,
@@ -50,11 +55,20 @@ def ingest_document(file_bytes: bytes, filename: str) -> Dict[str, Any]:
 
 
 # Query function that uses the LangChain RetrievalQA chain
-def answer_query(query: str, top_k: int = 5, model: str | None = None) -> Dict[str, Any]:
+def answer_query(
+    query: str,
+    top_k: int = 5,
+    model: str | None = None,
+    doc_ids: Optional[List[str]] = None,
+    page_from: Optional[int] = None,
+    page_to: Optional[int] = None
+) -> Dict[str, Any]:
     """
     Runs RetrievalQA chain and returns answer + source documents metadata.
+    doc_ids / page_from / page_to restrict retrieval inside the vector search.
     """
-    chain = get_qa_chain(k=top_k, model=model)
+    where_filter = build_where_filter(doc_ids=doc_ids, page_from=page_from, page_to=page_to)
+    chain = get_qa_chain(k=top_k, model=model, where_filter=where_filter)
     res = chain({"query": query})
 
     answer = res.get("result") or res.get("answer") or res.get("output_text") or ""
@@ -1,18 +1,45 @@
 # app/main.py
 from fastapi import FastAPI, UploadFile, File, HTTPException
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel
-from typing import Optional
+from typing import Optional, List
 
 from .langchain_integration import ingest_document, answer_query
-from .nodes.vector_upsert import create_schema
+from .nodes.vector_upsert import create_schema, delete_by_doc_id
+from .doc_registry import list_documents, get_document, unregister_document
+from .bulk_ingest import forget_document
+from .preload import PRELOAD_ON_STARTUP, start_preload, get_state, is_ready, is_running
 
 app = FastAPI(title="DocumentQA - LangChain RetrievalQA")
 
+@app.on_event("startup")
+def preload_on_startup():
+    """
+    Opt-in (PRELOAD_ON_STARTUP=1): warm models and connections in the background.
+    """
+    if PRELOAD_ON_STARTUP:
+        start_preload()
+
+
 @app.get("/health")
 async def health():
     return {"status": "ok"}
 
 
+@app.get("/ready")
+async def ready():
+    """
+    Readiness probe: 503 until preloading has finished successfully.
+    A preload that ended in "failed" is re-attempted in the background.
+    """
+    state = get_state()
+    if state["status"] == "failed" and not is_running():
+        start_preload()
+    if not is_ready():
+        return JSONResponse(status_code=503, content=state)
+    return state
+
+
 @app.post("/create_schema")
 def create_schema_route():
     """
@@ -42,15 +69,69 @@ async def ingest(file: UploadFile = File(...)):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.get("/documents")
+def documents():
+    """
+    List ingested documents from the registry.
+    """
+    try:
+        return {"documents": list_documents()}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@app.delete("/documents/{doc_id}")
+def delete_document(doc_id: str):
+    """
+    Bulk-delete a document's vectors from Weaviate and remove it from the registry.
+    The vector delete always runs, so documents that were never registered
+    (ingested before the registry, or a bulk ingest that failed partway) can
+    still be removed.
+    """
+    try:
+        registered = get_document(doc_id) is not None
+        deleted = delete_by_doc_id(doc_id)
+        if not registered and deleted["matches"] == 0:
+            raise HTTPException(status_code=404, detail=f"unknown doc_id: {doc_id}")
+        if deleted["failed"]:
+            raise HTTPException(
+                status_code=500,
+                detail={"message": "some vectors could not be deleted", "doc_id": doc_id, "vectors": deleted},
+            )
+        # let a later bulk ingest of the same file start over instead of skipping it;
+        # done before unregistering so a failure here leaves the delete retryable
+        forget_document(doc_id)
+        unregister_document(doc_id)
+        return {"message": "document deleted", "doc_id": doc_id, "vectors": deleted}
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 class AskRequest(BaseModel):
     query: str
     top_k: Optional[int] = 5
     model: Optional[str] = None
+    doc_ids: Optional[List[str]] = None
+    page_from: Optional[int] = None
+    page_to: Optional[int] = None
 
 @app.post("/ask")
 def ask(req: AskRequest):
+    if req.page_from is not None and req.page_to is not None and req.page_from > req.page_to:
+        raise HTTPException(status_code=400, detail="page_from must be <= page_to")
+    if req.doc_ids is not None and not req.doc_ids:
+        raise HTTPException(status_code=400, detail="doc_ids must not be empty; omit it to search all documents")
     try:
-        res = answer_query(req.query, top_k=req.top_k, model=req.model)
+        res = answer_query(
+            req.query,
+            top_k=req.top_k,
+            model=req.model,
+            doc_ids=req.doc_ids,
+            page_from=req.page_from,
+            page_to=req.page_to,
+        )
         return res
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
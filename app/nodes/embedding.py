@@ -1,14 +1,10 @@
 # app/nodes/embedder.py
 
+import threading
 from typing import List, Optional
 
-# Try import
-try:
-    from sentence_transformers import SentenceTransformer
-except ImportError:
-    SentenceTransformer = None
-
 _MODEL = None
+_MODEL_LOCK = threading.Lock()
 
 def load_model(model_name: str = "all-MiniLM-L6-v2"):
     """
@@ -16,23 +12,46 @@ def load_model(model_name: str = "all-MiniLM-L6-v2"):
     Call this once, or let embed_texts load it automatically.
     """
     global _MODEL
-    if SentenceTransformer is None:
+    # imported here: sentence-transformers pulls in torch, which dominates import time
+    try:
+        from sentence_transformers import SentenceTransformer
+    except ImportError:
         raise ImportError("Install sentence-transformers: pip install sentence-transformers")
     _MODEL = SentenceTransformer(model_name)
     return _MODEL
 
 
+def set_model(model):
+    """
+    Use an already-loaded SentenceTransformer (e.g. the one inside the LangChain
+    embeddings) instead of loading a second copy.
+    """
+    global _MODEL
+    with _MODEL_LOCK:
+        _MODEL = model
+    return _MODEL
+
+
+def get_model(model_name: str = "all-MiniLM-L6-v2"):
+    """
+    Return the loaded model, loading it on first use.
+    The lock makes concurrent first calls (preload thread + requests) load it once.
+    """
+    if _MODEL is None:
+        with _MODEL_LOCK:
+            if _MODEL is None:
+                load_model(model_name)
+    return _MODEL
+
+
 def embed_texts(texts: List[str], model_name: str = "all-MiniLM-L6-v2") -> List[List[float]]:
     """
     Embed a list of texts using a local sentence-transformers model.
     Returns a list of vectors.
     """
-    global _MODEL
-
-    if _MODEL is None:     # lazy load
-        load_model(model_name)
+    model = get_model(model_name)     # lazy load
 
-    vectors = _MODEL.encode(texts, convert_to_numpy=False, show_progress_bar=False)
+    vectors = model.encode(texts, convert_to_numpy=False, show_progress_bar=False)
     return [list(v) for v in vectors]
 
 
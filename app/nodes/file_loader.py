@@ -5,7 +5,6 @@ from pathlib import Path
 from typing import Dict, Any
 
 TMP_UPLOAD_DIR = Path("data/temp/uploads")
-TMP_UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
 
 
 def file_loader_from_bytes(file_bytes: bytes, filename: str) -> Dict[str, Any]:
@@ -33,7 +32,8 @@ def file_loader_from_bytes(file_bytes: bytes, filename: str) -> Dict[str, Any]:
     # Create deterministic unique id for the document
     doc_id = str(uuid.uuid4())
 
-    # Save to tmp/uploads using the doc_id as the name
+    # Save to tmp/uploads using the doc_id as the name (created on first use, not at import)
+    TMP_UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
     tmp_name = f"{doc_id}.{ext}"
     tmp_path = TMP_UPLOAD_DIR / tmp_name
 
@@ -1,23 +1,70 @@
 # app/nodes/vector_search.py
 from typing import List, Dict, Any, Optional
-from app.nodes.embedder import embed_texts
-import weaviate
+from app.nodes.embedding import embed_texts
 import os
 
 WEAVIATE_URL = os.getenv("WEAVIATE_URL", "http://localhost:8080")
 
 def _get_client():
+    import weaviate
     return weaviate.Client(WEAVIATE_URL)
 
-def search_query(query: str, top_k: int = 5, model_name: str = "all-MiniLM-L6-v2") -> List[Dict[str, Any]]:
+def build_where_filter(
+    doc_ids: Optional[List[str]] = None,
+    page_from: Optional[int] = None,
+    page_to: Optional[int] = None
+) -> Optional[Dict[str, Any]]:
+    """
+    Build a Weaviate `where` filter restricting the search to some documents and/or a page range.
+    Weaviate applies it as a pre-filter on the HNSW search, so top_k is taken from matching chunks only.
+    Returns None when no restriction is requested; an empty doc_ids list is
+    rejected rather than silently searching every document.
+    """
+    if doc_ids is not None and not doc_ids:
+        raise ValueError("doc_ids must not be empty")
+
+    operands = []
+
+    if doc_ids:
+        doc_filters = [
+            {"path": ["doc_id"], "operator": "Equal", "valueString": d}
+            for d in dict.fromkeys(doc_ids)
+        ]
+        if len(doc_filters) == 1:
+            operands.append(doc_filters[0])
+        else:
+            operands.append({"operator": "Or", "operands": doc_filters})
+
+    if page_from is not None:
+        operands.append({"path": ["page"], "operator": "GreaterThanEqual", "valueInt": page_from})
+    if page_to is not None:
+        operands.append({"path": ["page"], "operator": "LessThanEqual", "valueInt": page_to})
+
+    if not operands:
+        return None
+    if len(operands) == 1:
+        return operands[0]
+    return {"operator": "And", "operands": operands}
+
+
+def search_query(
+    query: str,
+    top_k: int = 5,
+    model_name: str = "all-MiniLM-L6-v2",
+    where_filter: Optional[Dict[str, Any]] = None
+) -> List[Dict[str, Any]]:
     """
     Embed the query and perform a near-vector search in Weaviate.
+    where_filter (see build_where_filter) is pushed down into the search.
     Returns a list of dicts: { "text", "doc_id", "page", "score" } (score may be None if not present)
     """
     vec = embed_texts([query], model_name=model_name)[0]
 
     client = _get_client()
-    res = client.query.get("DocumentChunk", ["text", "doc_id", "page"]).with_near_vector({"vector": vec}).with_limit(top_k).do()
+    q = client.query.get("DocumentChunk", ["text", "doc_id", "page"]).with_near_vector({"vector": vec})
+    if where_filter:
+        q = q.with_where(where_filter)
+    res = q.with_limit(top_k).do()
 
     hits = []
     try:
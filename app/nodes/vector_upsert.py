@@ -1,9 +1,18 @@
-import weaviate
+import uuid
 from typing import List, Dict
 
 WEAVIATE_URL = "http://localhost:8080"
 
+# Weaviate object ids must be UUIDs; chunk ids like "<doc_id>_p1_c0" are mapped
+# onto a stable uuid5 so re-upserting the same chunk overwrites it.
+CHUNK_NAMESPACE = uuid.uuid5(uuid.NAMESPACE_URL, "documentqa/DocumentChunk")
+
+
+def chunk_uuid(chunk_id: str) -> str:
+    return str(uuid.uuid5(CHUNK_NAMESPACE, chunk_id))
+
 def get_client():
+    import weaviate
     return weaviate.Client(WEAVIATE_URL)
 
 
@@ -33,11 +42,11 @@ def create_schema():
     client.schema.create(schema)
 
 
-def vector_upsert(objects: List[Dict]):
+def vector_upsert(objects: List[Dict], client=None):
     """
     objects = [
         {
-            "id": "doc123_p1_c0",
+            "id": "doc123_p1_c0",      # readable chunk id, converted with chunk_uuid()
             "vector": [0.12, 0.8, ...],
             "properties": {
                 "text": "...",
@@ -47,14 +56,56 @@ def vector_upsert(objects: List[Dict]):
         },
         ...
     ]
+    Pass `client` to reuse a long-lived client (e.g. one per bulk-ingest worker).
+    Raises RuntimeError if Weaviate rejects any object: the batch context manager
+    only reports per-object errors through its callback, it never raises.
     """
-    client = get_client()
+    client = client or get_client()
+    errors = []
 
-    with client.batch(batch_size=20) as batch:
+    def collect_errors(results):
+        for r in results or []:
+            err = (r.get("result") or {}).get("errors")
+            if err:
+                errors.append({"id": r.get("id"), "errors": err})
+
+    with client.batch(batch_size=20, callback=collect_errors) as batch:
         for obj in objects:
             batch.add_data_object(
                 data_object=obj["properties"],
                 class_name="DocumentChunk",
-                uuid=obj["id"],
+                uuid=chunk_uuid(obj["id"]),
                 vector=obj["vector"]
             )
+
+    if errors:
+        raise RuntimeError(
+            f"Weaviate rejected {len(errors)} of {len(objects)} object(s); first error: {errors[0]['errors']}"
+        )
+
+
+def delete_by_doc_id(doc_id: str) -> Dict:
+    """
+    Bulk-delete every DocumentChunk belonging to doc_id.
+    One delete_objects call removes at most QUERY_MAXIMUM_RESULTS objects, so it
+    is repeated until nothing matches or a round reports failures.
+    Returns summed counts: { "matches", "successful", "failed" }.
+    """
+    client = get_client()
+    where = {"path": ["doc_id"], "operator": "Equal", "valueString": doc_id}
+    totals = {"matches": 0, "successful": 0, "failed": 0}
+
+    while True:
+        res = client.batch.delete_objects(class_name="DocumentChunk", where=where)
+        results = (res or {}).get("results", {})
+        matches = results.get("matches", 0)
+        if not matches:
+            return totals
+
+        totals["matches"] += matches
+        totals["successful"] += results.get("successful", 0)
+        totals["failed"] += results.get("failed", 0)
+        if results.get("failed"):
+            return totals  # caller reports the failure; another round would hit the same objects
+        if not results.get("successful"):
+            raise RuntimeError(f"{matches} object(s) for doc_id {doc_id} could not be deleted")
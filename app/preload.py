@@ -0,0 +1,143 @@
+# app/preload.py
+"""
+Opt-in startup preload and readiness state.
+
+Set PRELOAD_ON_STARTUP=1 to load the embedding model, the Weaviate connection
+and the LangChain/Groq integrations in parallel when the app starts. Until that
+finishes, /ready answers 503 so a load balancer keeps traffic away; /health
+stays a plain liveness check.
+"""
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Callable
+
+from . import langchain_config
+
+PRELOAD_ON_STARTUP = os.getenv("PRELOAD_ON_STARTUP", "0").lower() in {"1", "true", "yes"}
+PRELOAD_RETRIES = int(os.getenv("PRELOAD_RETRIES", "5"))
+PRELOAD_BACKOFF_S = float(os.getenv("PRELOAD_BACKOFF_S", "1.0"))
+PRELOAD_MAX_BACKOFF_S = 30.0
+
+_LOCK = threading.Lock()
+_RUN_LOCK = threading.Lock()
+_STATE: Dict[str, Any] = {
+    # ready unless preloading is enabled; start_preload() flips it to "loading"
+    "status": "loading" if PRELOAD_ON_STARTUP else "ready",
+    "timings_s": {},
+    "errors": {},
+    "attempts": 0,
+}
+
+
+def _import_llm():
+    from langchain_groq import ChatGroq  # noqa: F401
+
+
+def _import_vectorstore():
+    from langchain_community.vectorstores import Weaviate  # noqa: F401
+
+
+# /ask uses langchain_config's embeddings and v4 Weaviate client. get_embeddings
+# also hands its model to app.nodes.embedding, so /ingest is warmed by the same
+# task. The v3 clients in vector_upsert/vector_search are created per call and
+# are not preloaded.
+PRELOAD_TASKS: Dict[str, Callable[[], Any]] = {
+    "embeddings": langchain_config.get_embeddings,
+    "weaviate": langchain_config.get_weaviate_client,
+    "vectorstore": _import_vectorstore,
+    "llm": _import_llm,
+    "retrieval_chain": langchain_config._load_retrieval_helpers,
+}
+
+
+def _run_task(name: str, fn: Callable[[], Any]):
+    started = time.perf_counter()
+    try:
+        fn()
+    except Exception as e:
+        with _LOCK:
+            _STATE["errors"][name] = str(e)
+    finally:
+        with _LOCK:
+            _STATE["timings_s"][name] = round(time.perf_counter() - started, 3)
+
+
+def _run_parallel(tasks: Dict[str, Callable[[], Any]]):
+    with ThreadPoolExecutor(max_workers=len(tasks)) as pool:
+        for name, fn in tasks.items():
+            pool.submit(_run_task, name, fn)
+
+
+def preload(
+    tasks: Dict[str, Callable[[], Any]] = None,
+    retries: int = PRELOAD_RETRIES,
+    backoff_s: float = PRELOAD_BACKOFF_S,
+) -> Dict[str, Any]:
+    """
+    Run every preload task in parallel and set the readiness status.
+    Failed tasks (e.g. Weaviate still starting) are retried with exponential
+    backoff; only a task that fails every attempt leaves the status "failed".
+    Returns a snapshot of the readiness state.
+    """
+    tasks = tasks or PRELOAD_TASKS
+    if not _RUN_LOCK.acquire(blocking=False):
+        return get_state()  # another preload is already running
+    try:
+        with _LOCK:
+            _STATE["status"] = "loading"
+            _STATE["timings_s"] = {}
+            _STATE["errors"] = {}
+            _STATE["attempts"] = 0
+
+        started = time.perf_counter()
+        remaining = dict(tasks)
+        for attempt in range(retries + 1):
+            if attempt:
+                time.sleep(min(backoff_s * 2 ** (attempt - 1), PRELOAD_MAX_BACKOFF_S))
+            with _LOCK:
+                _STATE["attempts"] = attempt + 1
+                for name in remaining:
+                    _STATE["errors"].pop(name, None)
+            _run_parallel(remaining)
+            with _LOCK:
+                remaining = {n: fn for n, fn in remaining.items() if n in _STATE["errors"]}
+            if not remaining:
+                break
+
+        with _LOCK:
+            _STATE["timings_s"]["total"] = round(time.perf_counter() - started, 3)
+            _STATE["status"] = "failed" if _STATE["errors"] else "ready"
+    finally:
+        _RUN_LOCK.release()
+    return get_state()
+
+
+def start_preload() -> threading.Thread:
+    """
+    Run preload() in a background thread so the server can answer /health meanwhile.
+    Also used by /ready to re-attempt a preload that ended in "failed".
+    """
+    t = threading.Thread(target=preload, name="preload", daemon=True)
+    t.start()
+    return t
+
+
+def get_state() -> Dict[str, Any]:
+    with _LOCK:
+        return {
+            "status": _STATE["status"],
+            "timings_s": dict(_STATE["timings_s"]),
+            "errors": dict(_STATE["errors"]),
+            "attempts": _STATE["attempts"],
+        }
+
+
+def is_running() -> bool:
+    return _RUN_LOCK.locked()
+
+
+def is_ready() -> bool:
+    with _LOCK:
+        return _STATE["status"] == "ready"
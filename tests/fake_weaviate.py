@@ -0,0 +1,46 @@
+"""Minimal stand-in for the v3 weaviate.Client batch API used by app.nodes.vector_upsert."""
+
+
+class FakeBatch:
+    def __init__(self, reject=(), delete_rounds=()):
+        self.reject = set(reject)           # uuids to report as rejected
+        self.delete_rounds = list(delete_rounds)
+        self.delete_calls = 0
+        self.added = []
+        self._callback = None
+        self._pending = []
+
+    # client.batch(batch_size=..., callback=...) -> context manager
+    def __call__(self, batch_size=None, callback=None):
+        self._callback = callback
+        return self
+
+    def __enter__(self):
+        self._pending = []
+        return self
+
+    def __exit__(self, *exc):
+        results = []
+        for obj in self._pending:
+            result = {"id": obj["uuid"], "result": {}}
+            if obj["uuid"] in self.reject:
+                result["result"]["errors"] = {"error": [{"message": "vector lengths don't match"}]}
+            else:
+                self.added.append(obj)
+            results.append(result)
+        if self._callback:
+            self._callback(results)
+        return False
+
+    def add_data_object(self, data_object, class_name, uuid, vector):
+        self._pending.append({"properties": data_object, "class_name": class_name, "uuid": uuid, "vector": vector})
+
+    def delete_objects(self, class_name, where):
+        self.delete_calls += 1
+        matches, successful, failed = self.delete_rounds.pop(0) if self.delete_rounds else (0, 0, 0)
+        return {"results": {"matches": matches, "successful": successful, "failed": failed, "limit": 10000}}
+
+
+class FakeClient:
+    def __init__(self, **kwargs):
+        self.batch = FakeBatch(**kwargs)
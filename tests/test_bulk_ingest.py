@@ -0,0 +1,215 @@
+import functools
+import multiprocessing
+import zipfile
+
+import pytest
+
+from app import bulk_ingest, doc_registry
+from app.nodes.vector_upsert import chunk_uuid
+from tests.fake_weaviate import FakeClient
+
+# The stubs below are module globals patched in the parent; only forked
+# workers inherit them (spawn/forkserver re-import the real modules).
+pytestmark = pytest.mark.skipif(
+    "fork" not in multiprocessing.get_all_start_methods(), reason="needs the fork start method"
+)
+FORK = multiprocessing.get_context("fork") if "fork" in multiprocessing.get_all_start_methods() else None
+
+
+def _fake_embed_chunks(chunks, model_name=None):
+    return [dict(c, vector=[0.0, 1.0]) for c in chunks]
+
+
+def _failing_upsert(objects, client=None):
+    raise RuntimeError("weaviate down")
+
+
+@pytest.fixture
+def corpus(tmp_path, monkeypatch):
+    src = tmp_path / "corpus"
+    src.mkdir()
+    (src / "a.txt").write_text("First sentence. Second sentence.")
+    (src / "b.txt").write_text("Another document. With two sentences.")
+    (src / "skip.png").write_bytes(b"not ingested")
+
+    monkeypatch.setattr(doc_registry, "DOC_REGISTRY_PATH", str(tmp_path / "registry.db"))
+    # workers are forked (see FORK), so patched module globals carry over to them
+    monkeypatch.setattr(bulk_ingest, "load_model", lambda model_name: None)
+    monkeypatch.setattr(bulk_ingest, "embed_chunks", _fake_embed_chunks)
+    monkeypatch.setattr(bulk_ingest, "get_client", lambda: None)
+    return src
+
+
+def _run(src, tmp_path, **kwargs):
+    return bulk_ingest.bulk_ingest(
+        str(src), checkpoint_path=str(tmp_path / "ckpt.db"), workers=1, mp_context=FORK, **kwargs
+    )
+
+
+def test_discover_files_directory_and_zip(corpus, tmp_path):
+    names = [t["filename"] for t in bulk_ingest.discover_files(str(corpus))]
+    assert names == ["a.txt", "b.txt"]
+
+    archive = tmp_path / "corpus.zip"
+    with zipfile.ZipFile(archive, "w") as zf:
+        zf.write(corpus / "a.txt", "sub/a.txt")
+        zf.write(corpus / "skip.png", "skip.png")
+    tasks = bulk_ingest.discover_files(str(archive))
+    assert [t["member"] for t in tasks] == ["sub/a.txt"]
+    assert tasks[0]["file_key"].endswith("corpus.zip::sub/a.txt")
+
+
+def test_rerun_skips_done_files(corpus, tmp_path, monkeypatch):
+    monkeypatch.setattr(bulk_ingest, "vector_upsert", lambda objects, client=None: None)
+
+    first = _run(corpus, tmp_path)
+    assert first["files_ingested"] == 2
+    assert first["files_failed"] == 0
+    assert {d["filename"] for d in doc_registry.list_documents()} == {"a.txt", "b.txt"}
+
+    second = _run(corpus, tmp_path)
+    assert second["files_ingested"] == 0
+    assert second["files_already_done"] == 2
+
+
+def test_failed_files_are_retried_by_default(corpus, tmp_path, monkeypatch):
+    monkeypatch.setattr(bulk_ingest, "vector_upsert", _failing_upsert)
+    first = _run(corpus, tmp_path)
+    assert first["files_failed"] == 2
+
+    skipped = _run(corpus, tmp_path, skip_failed=True)
+    assert skipped["files_skipped_failed"] == 2
+    assert skipped["files_ingested"] == 0
+
+    monkeypatch.setattr(bulk_ingest, "vector_upsert", lambda objects, client=None: None)
+    retried = _run(corpus, tmp_path)
+    assert retried["files_retried"] == 2
+    assert retried["files_ingested"] == 2
+    assert retried["files_failed"] == 0
+
+
+def test_resume_skips_chunks_already_upserted(corpus, tmp_path, monkeypatch):
+    # three sentences too long to share a chunk -> three chunks
+    (corpus / "a.txt").write_text(" ".join(f"Sentence {i} {'x' * 700}." for i in range(3)))
+    (corpus / "b.txt").unlink()
+
+    ckpt = bulk_ingest.Checkpoint(str(tmp_path / "ckpt.db"))
+    task = bulk_ingest.discover_files(str(corpus))[0]
+    # simulate a crash after the first chunk of a.txt was upserted
+    ckpt.mark_file(task["file_key"], "doc-a", "running")
+    ckpt.mark_chunks("doc-a", ["doc-a_p1_c0"])
+    ckpt.close()
+
+    # upserts run in the worker process, so record them in a file
+    log = tmp_path / "upserted.txt"
+
+    def record_upsert(objects, client=None):
+        with open(log, "a") as f:
+            f.writelines(o["id"] + "\n" for o in objects)
+
+    monkeypatch.setattr(bulk_ingest, "vector_upsert", record_upsert)
+    res = _run(corpus, tmp_path, batch_size=1)
+
+    assert res["files_ingested"] == 1
+    assert log.read_text().split() == ["doc-a_p1_c1", "doc-a_p1_c2"]
+    ckpt = bulk_ingest.Checkpoint(str(tmp_path / "ckpt.db"))
+    assert ckpt.get_file(task["file_key"]) == {"doc_id": "doc-a", "status": "done"}
+    assert ckpt.done_chunks("doc-a") == {"doc-a_p1_c0", "doc-a_p1_c1", "doc-a_p1_c2"}
+    ckpt.close()
+
+
+def test_main_exit_code_reflects_failed_files(corpus, tmp_path, monkeypatch):
+    monkeypatch.setattr(bulk_ingest, "bulk_ingest", functools.partial(bulk_ingest.bulk_ingest, mp_context=FORK))
+    monkeypatch.setattr(bulk_ingest, "vector_upsert", _failing_upsert)
+    argv = [str(corpus), "--checkpoint", str(tmp_path / "ckpt.db"), "--workers", "1"]
+    assert bulk_ingest.main(argv) == 1
+    assert bulk_ingest.main(argv + ["--skip-failed"]) == 1
+
+    monkeypatch.setattr(bulk_ingest, "vector_upsert", lambda objects, client=None: None)
+    assert bulk_ingest.main(argv) == 0
+
+
+def test_zip_members_are_ingested(corpus, tmp_path, monkeypatch):
+    archive = tmp_path / "corpus.zip"
+    with zipfile.ZipFile(archive, "w") as zf:
+        zf.write(corpus / "a.txt", "sub/a.txt")
+    monkeypatch.setattr(bulk_ingest, "vector_upsert", lambda objects, client=None: None)
+
+    res = _run(archive, tmp_path)
+    assert res["files_ingested"] == 1
+    assert [d["filename"] for d in doc_registry.list_documents()] == ["a.txt"]
+
+
+def test_forget_document_allows_reingest(corpus, tmp_path, monkeypatch):
+    monkeypatch.setattr(bulk_ingest, "vector_upsert", lambda objects, client=None: None)
+    _run(corpus, tmp_path)
+    doc_id = next(d["doc_id"] for d in doc_registry.list_documents() if d["filename"] == "a.txt")
+
+    bulk_ingest.forget_document(doc_id, checkpoint_path=str(tmp_path / "ckpt.db"))
+    res = _run(corpus, tmp_path)
+    assert res["files_ingested"] == 1
+    assert res["files_already_done"] == 1
+
+
+def test_forget_document_without_checkpoint_is_noop(tmp_path):
+    bulk_ingest.forget_document("doc", checkpoint_path=str(tmp_path / "missing.db"))
+    assert not (tmp_path / "missing.db").exists()
+
+
+def test_workers_reuse_one_client(corpus, tmp_path, monkeypatch):
+    log = tmp_path / "clients.txt"
+
+    def make_client():
+        with open(log, "a") as f:
+            f.write("created\n")
+        return "worker-client"
+
+    def record_upsert(objects, client=None):
+        with open(log, "a") as f:
+            f.write(f"upsert {client}\n")
+
+    monkeypatch.setattr(bulk_ingest, "get_client", make_client)
+    monkeypatch.setattr(bulk_ingest, "vector_upsert", record_upsert)
+    _run(corpus, tmp_path, batch_size=1)
+
+    lines = log.read_text().splitlines()
+    assert lines.count("created") == 1
+    assert lines.count("upsert worker-client") == len(lines) - 1 >= 2
+
+
+def test_rejected_objects_are_not_checkpointed(corpus, tmp_path, monkeypatch):
+    (corpus / "b.txt").unlink()
+    task = bulk_ingest.discover_files(str(corpus))[0]
+    ckpt = bulk_ingest.Checkpoint(str(tmp_path / "ckpt.db"))
+    ckpt.mark_file(task["file_key"], "doc-a", "running")
+    ckpt.close()
+
+    # real vector_upsert against a client that rejects the chunk, as Weaviate
+    # does on e.g. a vector-dimension mismatch
+    monkeypatch.setattr(bulk_ingest, "get_client", lambda: FakeClient(reject={chunk_uuid("doc-a_p1_c0")}))
+    res = _run(corpus, tmp_path)
+
+    assert res["files_failed"] == 1
+    assert doc_registry.list_documents() == []
+    ckpt = bulk_ingest.Checkpoint(str(tmp_path / "ckpt.db"))
+    assert ckpt.get_file(task["file_key"])["status"] == "failed"
+    assert ckpt.done_chunks("doc-a") == set()
+    ckpt.close()
+
+
+def test_checkpoint_chunk_counter(tmp_path):
+    ckpt = bulk_ingest.Checkpoint(str(tmp_path / "ckpt.db"))
+    ckpt.mark_chunks("a", ["a_p1_c0", "a_p1_c1"])
+    ckpt.mark_chunks("a", ["a_p1_c1", "a_p1_c2"])  # c1 already recorded
+    ckpt.mark_chunks("b", ["b_p1_c0"])
+    assert ckpt.count_chunks() == 4
+
+    ckpt.forget_doc("a")
+    assert ckpt.count_chunks() == 1
+    assert ckpt.done_chunks("a") == set()
+    plan = ckpt.conn.execute("EXPLAIN QUERY PLAN SELECT chunk_id FROM chunks WHERE doc_id = 'b'").fetchall()
+    assert "chunks_doc_id" in str(plan)
+    ckpt.close()
+
+    # reopening does not reset the counter
+    assert bulk_ingest.Checkpoint(str(tmp_path / "ckpt.db")).count_chunks() == 1
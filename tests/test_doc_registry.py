@@ -0,0 +1,32 @@
+import pytest
+
+from app import doc_registry
+
+
+@pytest.fixture(autouse=True)
+def registry(tmp_path, monkeypatch):
+    monkeypatch.setattr(doc_registry, "DOC_REGISTRY_PATH", str(tmp_path / "registry.db"))
+
+
+def test_register_list_and_get():
+    doc_registry.register_document("a", "a.pdf", 3, 10)
+    doc_registry.register_document("b", "b.pdf", 1, 2)
+
+    assert [d["doc_id"] for d in doc_registry.list_documents()] == ["b", "a"]
+    doc = doc_registry.get_document("a")
+    assert (doc["filename"], doc["page_count"], doc["chunk_count"]) == ("a.pdf", 3, 10)
+    assert doc["ingested_at"] > 0
+
+
+def test_register_replaces_existing_entry():
+    doc_registry.register_document("a", "a.pdf", 3, 10)
+    doc_registry.register_document("a", "a.pdf", 4, 12)
+    assert len(doc_registry.list_documents()) == 1
+    assert doc_registry.get_document("a")["chunk_count"] == 12
+
+
+def test_unregister():
+    doc_registry.register_document("a", "a.pdf", 3, 10)
+    assert doc_registry.unregister_document("a") is True
+    assert doc_registry.unregister_document("a") is False
+    assert doc_registry.get_document("a") is None
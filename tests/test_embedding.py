@@ -0,0 +1,54 @@
+import sys
+import threading
+import time
+import types
+
+import pytest
+
+from app import langchain_config
+from app.nodes import embedding
+
+
+@pytest.fixture(autouse=True)
+def fresh_model(monkeypatch):
+    monkeypatch.setattr(embedding, "_MODEL", None)
+    monkeypatch.setattr(langchain_config, "_EMBEDDINGS", None)
+
+
+def test_get_model_loads_once_under_concurrency(monkeypatch):
+    loads = []
+
+    def slow_load(model_name):
+        loads.append(model_name)
+        time.sleep(0.05)
+        embedding._MODEL = object()
+        return embedding._MODEL
+
+    monkeypatch.setattr(embedding, "load_model", slow_load)
+
+    threads = [threading.Thread(target=embedding.get_model) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(loads) == 1
+
+
+def test_langchain_embeddings_share_their_model(monkeypatch):
+    class FakeSentenceTransformerEmbeddings:
+        instances = 0
+
+        def __init__(self, model_name):
+            FakeSentenceTransformerEmbeddings.instances += 1
+            self.client = object()
+
+    fake_module = types.ModuleType("langchain_community.embeddings")
+    fake_module.SentenceTransformerEmbeddings = FakeSentenceTransformerEmbeddings
+    monkeypatch.setitem(sys.modules, "langchain_community", types.ModuleType("langchain_community"))
+    monkeypatch.setitem(sys.modules, "langchain_community.embeddings", fake_module)
+    monkeypatch.setattr(embedding, "load_model", lambda model_name: pytest.fail("model loaded twice"))
+
+    emb = langchain_config.get_embeddings()
+    assert langchain_config.get_embeddings() is emb
+    assert embedding.get_model() is emb.client
+    assert FakeSentenceTransformerEmbeddings.instances == 1
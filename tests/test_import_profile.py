@@ -0,0 +1,38 @@
+from app import import_profile
+
+
+def test_profile_imports_parses_importtime_output():
+    profile = import_profile.profile_imports("json")
+    names = {e["name"] for e in profile["entries"]}
+
+    assert profile["module"] == "json"
+    assert "json" in names
+    assert profile["total_us"] > 0
+    top = next(e for e in profile["entries"] if e["name"] == "json")
+    assert top["depth"] == 0
+    assert top["cumulative_us"] >= top["self_us"]
+    assert any(e["depth"] > 0 for e in profile["entries"])
+
+
+def test_langchain_config_import_does_not_pull_heavy_dependencies():
+    profile = import_profile.profile_imports("app.langchain_config")
+    names = {e["name"] for e in profile["entries"]}
+    assert not names & {"weaviate", "langchain_community", "langchain_groq", "sentence_transformers", "torch"}
+
+
+def test_format_report_and_budget(capsys):
+    profile = {
+        "module": "pkg",
+        "total_us": 3000,
+        "entries": [
+            {"name": "pkg", "self_us": 500, "cumulative_us": 3000, "depth": 0},
+            {"name": "slow", "self_us": 2500, "cumulative_us": 2500, "depth": 1},
+        ],
+    }
+    lines = import_profile.format_report(profile, top=1).splitlines()
+    assert lines[0] == "import pkg: 3.0 ms total, 2 modules"
+    assert lines[-1].split() == ["3.0", "0.5", "pkg"]
+
+    assert import_profile.main(["json", "--budget-ms", "100000"]) == 0
+    assert import_profile.main(["json", "--budget-ms", "0"]) == 1
+    assert "over budget" in capsys.readouterr().err
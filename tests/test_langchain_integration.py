@@ -0,0 +1,36 @@
+import pytest
+
+from app import doc_registry, langchain_integration
+from app.nodes import file_loader
+
+
+@pytest.fixture
+def stubbed(tmp_path, monkeypatch):
+    monkeypatch.setattr(doc_registry, "DOC_REGISTRY_PATH", str(tmp_path / "registry.db"))
+    monkeypatch.setattr(file_loader, "TMP_UPLOAD_DIR", tmp_path / "uploads")
+    monkeypatch.setattr(langchain_integration, "get_embeddings", lambda: None)
+    monkeypatch.setattr(
+        langchain_integration, "embed_chunks", lambda chunks: [dict(c, vector=[0.0]) for c in chunks]
+    )
+    upserted = []
+    monkeypatch.setattr(langchain_integration, "vector_upsert", upserted.extend)
+    return upserted
+
+
+def test_ingest_document_registers_document(stubbed):
+    res = langchain_integration.ingest_document(b"One sentence. Two sentences.", "notes.txt")
+
+    doc = doc_registry.get_document(res["doc_id"])
+    assert doc["filename"] == "notes.txt"
+    assert doc["page_count"] == 1
+    assert doc["chunk_count"] == res["chunks"] == len(stubbed)
+
+
+def test_failed_upsert_does_not_register(stubbed, monkeypatch):
+    def broken_upsert(objects):
+        raise RuntimeError("weaviate down")
+
+    monkeypatch.setattr(langchain_integration, "vector_upsert", broken_upsert)
+    with pytest.raises(RuntimeError):
+        langchain_integration.ingest_document(b"One sentence.", "notes.txt")
+    assert doc_registry.list_documents() == []
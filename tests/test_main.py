@@ -0,0 +1,95 @@
+import pytest
+
+pytest.importorskip("fastapi")
+
+from fastapi import HTTPException  # noqa: E402
+
+from app import main  # noqa: E402
+
+
+@pytest.fixture
+def calls(monkeypatch):
+    calls = []
+    monkeypatch.setattr(main, "forget_document", lambda doc_id: calls.append(("forget", doc_id)))
+    monkeypatch.setattr(main, "unregister_document", lambda doc_id: calls.append(("unregister", doc_id)))
+    return calls
+
+
+def _stub_delete(monkeypatch, registered, results):
+    monkeypatch.setattr(main, "get_document", lambda doc_id: {"doc_id": doc_id} if registered else None)
+    monkeypatch.setattr(main, "delete_by_doc_id", lambda doc_id: results)
+
+
+def test_delete_registered_document(monkeypatch, calls):
+    _stub_delete(monkeypatch, True, {"matches": 3, "successful": 3, "failed": 0})
+    res = main.delete_document("doc")
+    assert res["vectors"]["successful"] == 3
+    assert calls == [("forget", "doc"), ("unregister", "doc")]
+
+
+def test_delete_unregistered_document_with_vectors(monkeypatch, calls):
+    _stub_delete(monkeypatch, False, {"matches": 2, "successful": 2, "failed": 0})
+    assert main.delete_document("doc")["message"] == "document deleted"
+    assert calls == [("forget", "doc"), ("unregister", "doc")]
+
+
+def test_delete_unknown_document_is_404(monkeypatch, calls):
+    _stub_delete(monkeypatch, False, {"matches": 0, "successful": 0, "failed": 0})
+    with pytest.raises(HTTPException) as exc:
+        main.delete_document("doc")
+    assert exc.value.status_code == 404
+    assert calls == []
+
+
+def test_registered_document_without_vectors_is_deleted(monkeypatch, calls):
+    _stub_delete(monkeypatch, True, {"matches": 0, "successful": 0, "failed": 0})
+    main.delete_document("doc")
+    assert ("unregister", "doc") in calls
+
+
+def test_delete_with_failures_keeps_registry_entry(monkeypatch, calls):
+    _stub_delete(monkeypatch, True, {"matches": 5, "successful": 3, "failed": 2})
+    with pytest.raises(HTTPException) as exc:
+        main.delete_document("doc")
+    assert exc.value.status_code == 500
+    assert exc.value.detail["vectors"]["failed"] == 2
+    assert calls == []
+
+
+def test_checkpoint_failure_keeps_registry_entry(monkeypatch, calls):
+    _stub_delete(monkeypatch, True, {"matches": 1, "successful": 1, "failed": 0})
+
+    def broken_forget(doc_id):
+        raise OSError("checkpoint locked")
+
+    monkeypatch.setattr(main, "forget_document", broken_forget)
+    with pytest.raises(HTTPException) as exc:
+        main.delete_document("doc")
+    assert exc.value.status_code == 500
+    assert calls == []
+
+
+@pytest.fixture
+def asked(monkeypatch):
+    asked = []
+
+    def fake_answer_query(query, **kwargs):
+        asked.append(kwargs)
+        return {"answer": "ok", "sources": []}
+
+    monkeypatch.setattr(main, "answer_query", fake_answer_query)
+    return asked
+
+
+def test_ask_passes_filters(asked):
+    res = main.ask(main.AskRequest(query="q", doc_ids=["a"], page_from=1, page_to=3))
+    assert res["answer"] == "ok"
+    assert asked == [{"top_k": 5, "model": None, "doc_ids": ["a"], "page_from": 1, "page_to": 3}]
+
+
+@pytest.mark.parametrize("fields", [{"page_from": 4, "page_to": 2}, {"doc_ids": []}])
+def test_ask_rejects_bad_filters(asked, fields):
+    with pytest.raises(HTTPException) as exc:
+        main.ask(main.AskRequest(query="q", **fields))
+    assert exc.value.status_code == 400
+    assert asked == []
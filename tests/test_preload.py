@@ -0,0 +1,55 @@
+import copy
+
+import pytest
+
+from app import preload
+
+
+@pytest.fixture(autouse=True)
+def restore_state():
+    saved = copy.deepcopy(preload._STATE)
+    yield
+    with preload._LOCK:
+        preload._STATE.clear()
+        preload._STATE.update(saved)
+
+
+def test_preload_ready_when_all_tasks_succeed():
+    state = preload.preload({"a": lambda: None, "b": lambda: None}, retries=0)
+    assert state["status"] == "ready"
+    assert state["errors"] == {}
+    assert set(state["timings_s"]) == {"a", "b", "total"}
+    assert preload.is_ready()
+
+
+def test_preload_retries_failed_tasks_only():
+    calls = {"ok": 0, "flaky": 0}
+
+    def ok():
+        calls["ok"] += 1
+
+    def flaky():
+        calls["flaky"] += 1
+        if calls["flaky"] < 3:
+            raise ConnectionError("weaviate not up yet")
+
+    state = preload.preload({"ok": ok, "flaky": flaky}, retries=5, backoff_s=0)
+    assert state["status"] == "ready"
+    assert state["attempts"] == 3
+    assert calls == {"ok": 1, "flaky": 3}
+
+
+def test_preload_fails_after_exhausting_retries():
+    def broken():
+        raise RuntimeError("boom")
+
+    state = preload.preload({"broken": broken}, retries=2, backoff_s=0)
+    assert state["status"] == "failed"
+    assert state["attempts"] == 3
+    assert state["errors"] == {"broken": "boom"}
+    assert not preload.is_ready()
+
+
+def test_preload_tasks_load_the_embedding_model_once():
+    assert list(preload.PRELOAD_TASKS).count("embeddings") == 1
+    assert "ingest_embedding_model" not in preload.PRELOAD_TASKS
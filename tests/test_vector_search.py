@@ -0,0 +1,38 @@
+import pytest
+
+from app.nodes.vector_search import build_where_filter
+
+
+def test_no_filter():
+    assert build_where_filter() is None
+
+
+def test_single_doc_id():
+    assert build_where_filter(["a"]) == {"path": ["doc_id"], "operator": "Equal", "valueString": "a"}
+
+
+def test_doc_ids_and_page_range():
+    where = build_where_filter(["a", "b", "a"], page_from=2, page_to=5)
+    assert where == {
+        "operator": "And",
+        "operands": [
+            {
+                "operator": "Or",
+                "operands": [
+                    {"path": ["doc_id"], "operator": "Equal", "valueString": "a"},
+                    {"path": ["doc_id"], "operator": "Equal", "valueString": "b"},
+                ],
+            },
+            {"path": ["page"], "operator": "GreaterThanEqual", "valueInt": 2},
+            {"path": ["page"], "operator": "LessThanEqual", "valueInt": 5},
+        ],
+    }
+
+
+def test_page_from_only():
+    assert build_where_filter(page_from=3) == {"path": ["page"], "operator": "GreaterThanEqual", "valueInt": 3}
+
+
+def test_empty_doc_ids_rejected():
+    with pytest.raises(ValueError):
+        build_where_filter([])
@@ -0,0 +1,58 @@
+import uuid
+
+import pytest
+
+from app.nodes import vector_upsert
+from tests.fake_weaviate import FakeClient
+
+
+def _patch_client(monkeypatch, rounds):
+    client = FakeClient(delete_rounds=rounds)
+    monkeypatch.setattr(vector_upsert, "get_client", lambda: client)
+    return client
+
+
+def test_chunk_uuid_is_stable_uuid():
+    a = vector_upsert.chunk_uuid("doc_p1_c0")
+    assert a == vector_upsert.chunk_uuid("doc_p1_c0")
+    assert a != vector_upsert.chunk_uuid("doc_p1_c1")
+    assert uuid.UUID(a).version == 5
+
+
+def test_delete_repeats_until_nothing_matches(monkeypatch):
+    client = _patch_client(monkeypatch, [(10000, 10000, 0), (2500, 2500, 0)])
+    assert vector_upsert.delete_by_doc_id("doc") == {"matches": 12500, "successful": 12500, "failed": 0}
+    assert client.batch.delete_calls == 3
+
+
+def test_delete_stops_on_failures(monkeypatch):
+    client = _patch_client(monkeypatch, [(10000, 9990, 10), (10, 10, 0)])
+    assert vector_upsert.delete_by_doc_id("doc") == {"matches": 10000, "successful": 9990, "failed": 10}
+    assert client.batch.delete_calls == 1
+
+
+def test_delete_raises_when_no_progress(monkeypatch):
+    _patch_client(monkeypatch, [(5, 0, 0)])
+    with pytest.raises(RuntimeError):
+        vector_upsert.delete_by_doc_id("doc")
+
+
+def test_delete_unknown_doc(monkeypatch):
+    _patch_client(monkeypatch, [])
+    assert vector_upsert.delete_by_doc_id("doc") == {"matches": 0, "successful": 0, "failed": 0}
+
+
+def _objects(*ids):
+    return [{"id": i, "vector": [0.0], "properties": {"text": i, "doc_id": "doc", "page": 1}} for i in ids]
+
+
+def test_upsert_uses_uuid5_ids(monkeypatch):
+    client = FakeClient()
+    vector_upsert.vector_upsert(_objects("doc_p1_c0"), client=client)
+    assert [o["uuid"] for o in client.batch.added] == [vector_upsert.chunk_uuid("doc_p1_c0")]
+
+
+def test_upsert_raises_on_rejected_objects():
+    client = FakeClient(reject={vector_upsert.chunk_uuid("doc_p1_c1")})
+    with pytest.raises(RuntimeError, match="rejected 1 of 2"):
+        vector_upsert.vector_upsert(_objects("doc_p1_c0", "doc_p1_c1"), client=client)